@@ -9,8 +9,7 @@ a = Analysis([
     binaries=[],
     datas=[
         ('templates', 'templates'),
-        ('core', 'core'),
-        ('gui', 'gui'),
+        ('android_app_generator', 'android_app_generator'),
     ],
     hiddenimports=[],
     hookspath=[],
@@ -0,0 +1,10 @@
+"""
+Android App Generator
+
+Desktop application that uses local AI models to generate complete
+Android applications from natural language descriptions. The `core`
+subpackage holds the model and generation machinery, `gui` the Tkinter
+interface, and `main` the application entry point.
+"""
+
+__version__ = "1.0.0"
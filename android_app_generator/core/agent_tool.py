@@ -2,9 +2,10 @@ import os
 import json
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Dict, Any, Optional, List
 
-from core.llm_manager import LLMManager
+from android_app_generator.core.llm_manager import LLMManager
 
 
 class UserFriendlyAgent:
@@ -26,7 +27,8 @@ class UserFriendlyAgent:
     ) -> None:
         self.llm = llm_manager
         self.default_output_dir = default_output_dir or os.path.join(os.getcwd(), "output", "agent")
-        os.makedirs(self.default_output_dir, exist_ok=True)
+        # run() creates the directory when it is actually used, so
+        # constructing the agent does no filesystem work
 
     def _emit(self, cb: Optional[Callable[[str, str], None]], phase: str, message: str) -> None:
         if cb:
@@ -114,6 +116,7 @@ class UserFriendlyAgent:
         output_dir: Optional[str] = None,
         progress_cb: Optional[Callable[[str, str], None]] = None,
         file_cb: Optional[Callable[[str, str], None]] = None,
+        stop_event: Optional[threading.Event] = None,
     ) -> Dict[str, Any]:
         """
         Execute the friendly agent flow. Emits human-readable phases:
@@ -122,7 +125,13 @@ class UserFriendlyAgent:
         - generating: generating file content (multiple times)
         - writing: writing a file
         - done/error: finished
+
+        If stop_event is set while running, the agent stops between
+        phases/files and returns whatever was written so far.
         """
+        def cancelled() -> bool:
+            return stop_event is not None and stop_event.is_set()
+
         base_dir = output_dir or self.default_output_dir
         os.makedirs(base_dir, exist_ok=True)
 
@@ -137,6 +146,18 @@ class UserFriendlyAgent:
         written: List[Dict[str, str]] = []
         errors: List[str] = []
 
+        if cancelled():
+            self._emit(progress_cb, "done", "Stopped before creating any files.")
+            return {
+                "success": False,
+                "cancelled": True,
+                "output_dir": base_dir,
+                "written": written,
+                "errors": errors,
+                "plan": plan,
+                "summary": "Stopped by user.",
+            }
+
         self._emit(progress_cb, "preparing", "Creating folders for your project...")
         # Ensure all directories exist
         for spec in files:
@@ -147,7 +168,11 @@ class UserFriendlyAgent:
             if dir_name:
                 os.makedirs(dir_name, exist_ok=True)
 
+        was_cancelled = False
         for spec in files:
+            if cancelled():
+                was_cancelled = True
+                break
             rel = spec.get("path", "").strip()
             if not rel:
                 continue
@@ -167,11 +192,16 @@ class UserFriendlyAgent:
                 errors.append(msg)
                 self._emit(progress_cb, "error", msg)
 
-        summary = plan.get("summary", "Project created.")
-        self._emit(progress_cb, "done", "All set! Your files are ready.")
+        if was_cancelled:
+            summary = "Stopped by user; kept the files created so far."
+            self._emit(progress_cb, "done", "Stopped. Files created so far were kept.")
+        else:
+            summary = plan.get("summary", "Project created.")
+            self._emit(progress_cb, "done", "All set! Your files are ready.")
 
         return {
-            "success": len(errors) == 0,
+            "success": len(errors) == 0 and not was_cancelled,
+            "cancelled": was_cancelled,
             "output_dir": base_dir,
             "written": written,
             "errors": errors,
@@ -186,11 +216,13 @@ def run_agent_in_thread(
     output_dir: Optional[str],
     progress_cb: Optional[Callable[[str, str], None]],
     file_cb: Optional[Callable[[str, str], None]],
+    stop_event: Optional[threading.Event] = None,
 ):
-    """Helper to run the agent in a background thread."""
+    """Helper to run the agent on the shared background pool."""
     def worker():
         try:
-            agent.run(request=request, output_dir=output_dir, progress_cb=progress_cb, file_cb=file_cb)
+            agent.run(request=request, output_dir=output_dir, progress_cb=progress_cb,
+                      file_cb=file_cb, stop_event=stop_event)
         except Exception:
             if progress_cb:
                 try:
@@ -198,5 +230,10 @@ def run_agent_in_thread(
                 except Exception:
                     pass
 
-    threading.Thread(target=worker, daemon=True).start()
+    _AGENT_POOL.submit(worker)
+
+
+# Shared pool so repeated runs reuse threads and concurrency stays bounded
+# instead of spawning an unbounded thread per call
+_AGENT_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="agent")
 
@@ -3,8 +3,8 @@ import re
 import json
 import time
 from typing import Dict, List, Any, Optional, Callable
-from core.llm_manager import LLMManager
-from core.android_templates import AndroidTemplates
+from android_app_generator.core.llm_manager import LLMManager
+from android_app_generator.core.android_templates import AndroidTemplates
 
 
 class ProjectGenerator:
@@ -1,12 +1,14 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog, simpledialog
 import threading
+import queue
 import time
 import os
+import mmap
 from typing import Optional, Callable
-from core.llm_manager import LLMManager
-from core.project_generator import ProjectGenerator
-from core.agent_tool import UserFriendlyAgent
+from android_app_generator.core.llm_manager import LLMManager
+from android_app_generator.core.project_generator import ProjectGenerator
+from android_app_generator.core.agent_tool import UserFriendlyAgent
 
 
 class ChatPanel(ttk.Frame):
@@ -14,6 +16,10 @@ class ChatPanel(ttk.Frame):
     Enhanced chat panel with modern UI and project generation capabilities
     """
 
+    # Oldest chat lines are evicted past this bound so long agent runs keep
+    # appends cheap and memory flat
+    MAX_CHAT_LINES = 2000
+
     def __init__(self, parent, llm_manager: LLMManager, project_generator: ProjectGenerator):
         super().__init__(parent)
         self.llm_manager = llm_manager
@@ -22,9 +28,44 @@ class ChatPanel(ttk.Frame):
         self.current_project = None
         self.agent = UserFriendlyAgent(self.llm_manager)
 
+        # Streaming tokens are buffered and flushed to the chat widget in
+        # batches so a fast model doesn't schedule one UI update per token
+        self._token_buf = []
+        self._token_lock = threading.Lock()
+        self._token_flush_scheduled = False
+
+        # Agent progress ticks are coalesced the same way so a chatty
+        # phase can't flood the chat log with per-tick messages
+        self._progress_buf = []
+        self._progress_flush_scheduled = False
+
+        # Lets the Stop button interrupt an agent run between files
+        self._agent_stop = threading.Event()
+
+        # One long-lived worker thread takes background jobs off a queue,
+        # avoiding a fresh thread spawn per generation/build
+        self._jobs = queue.Queue()
+        threading.Thread(target=self._worker_loop, daemon=True).start()
+
         self.setup_ui()
         self.setup_bindings()
 
+    def _worker_loop(self):
+        """Run queued background jobs on the persistent worker thread"""
+        while True:
+            fn, args = self._jobs.get()
+            try:
+                fn(*args)
+            except Exception as e:
+                self.chat_text.after(
+                    0, lambda e=e: self.add_message("error", f"❌ Background task failed: {e}"))
+            finally:
+                self._jobs.task_done()
+
+    def _submit_job(self, fn, *args):
+        """Queue a callable for the persistent worker thread"""
+        self._jobs.put((fn, args))
+
     def setup_ui(self):
         """Setup the user interface"""
         # Configure grid weights
@@ -90,7 +131,12 @@ class ChatPanel(ttk.Frame):
             selectbackground='#0078d4',
             selectforeground='white',
             padx=10,
-            pady=10
+            pady=10,
+            # Append-only log: keep the undo machinery off so heavy
+            # token streams don't accumulate edit records
+            undo=False,
+            autoseparators=False,
+            maxundo=0
         )
         self.chat_text.grid(row=0, column=0, sticky='nsew')
 
@@ -251,65 +297,91 @@ class ChatPanel(ttk.Frame):
         if not output_dir:
             return
 
-        # Disable controls during run
+        # Disable controls during run; Stop stays live so the agent can
+        # be interrupted between files
         self.generating = True
+        self._agent_stop.clear()
         self.send_button.config(state='disabled')
-        self.stop_button.config(state='disabled')
+        self.stop_button.config(state='normal')
         self.generate_project_button.config(state='disabled')
         self.agent_builder_button.config(state='disabled')
 
         self.add_message("system", "🤝 Starting friendly AGENT. I'll keep you posted with short updates.")
         self.agent_progress_var.set("🧭 Planning the simplest way to build this...")
 
-        def progress_cb(phase: str, message: str):
-            def _ui():
-                icon = {
-                    'planning': '🧭',
-                    'preparing': '🗂️',
-                    'generating': '🛠️',
-                    'writing': '💾',
-                    'done': '✅',
-                    'error': '❌'
-                }.get(phase, 'ℹ️')
-                self.agent_progress_var.set(f"{icon} {message}")
-                # Also reflect in chat as system updates
-                self.add_message("system", f"{icon} {message}")
-            self.chat_text.after(0, _ui)
-
-        def file_cb(rel_path: str, abs_path: str):
-            def _ui():
-                self.add_message("assistant", f"Created file: {rel_path}\nPath: {abs_path}")
-            self.chat_text.after(0, _ui)
+        self._submit_job(self._agent_worker, request, output_dir)
+
+    # Bound methods rather than per-click closures: repeated agent runs
+    # reuse the same callables instead of reallocating them each time
+    _PHASE_ICONS = {
+        'planning': '🧭',
+        'preparing': '🗂️',
+        'generating': '🛠️',
+        'writing': '💾',
+        'done': '✅',
+        'error': '❌'
+    }
+
+    def _agent_flush_progress(self):
+        """Drain buffered agent progress ticks into the UI (main thread)"""
+        with self._token_lock:
+            pending = self._progress_buf
+            self._progress_buf = []
+            self._progress_flush_scheduled = False
+        if pending:
+            # Status line shows only the latest tick; the chat gets
+            # the whole batch in one message
+            self.agent_progress_var.set(pending[-1])
+            self.add_message("system", "\n".join(pending))
+
+    def _agent_progress_cb(self, phase: str, message: str):
+        icon = self._PHASE_ICONS.get(phase, 'ℹ️')
+        with self._token_lock:
+            self._progress_buf.append(f"{icon} {message}")
+            if self._progress_flush_scheduled:
+                return
+            self._progress_flush_scheduled = True
+        self.chat_text.after(50, self._agent_flush_progress)
+
+    def _agent_file_cb(self, rel_path: str, abs_path: str):
+        self.chat_text.after(0, lambda: self.add_message(
+            "assistant", f"Created file: {rel_path}\nPath: {abs_path}"))
+
+    def _agent_done(self, result):
+        self._agent_flush_progress()  # drain any ticks still buffered
+        files_list = "\n".join([f"• {w['path']}" for w in result.get('written', [])])
+        summary = result.get('summary', 'Done.')
+        if result.get('cancelled'):
+            self.add_message("system", f"Stopped.\n{summary}\n\nFiles:\n{files_list}")
+        else:
+            self.add_message("success", f"All done!\n{summary}\n\nFiles:\n{files_list}")
 
-        def worker():
-            try:
-                result = self.agent.run(
-                    request=request,
-                    output_dir=output_dir,
-                    progress_cb=progress_cb,
-                    file_cb=file_cb
-                )
+    def _agent_error(self, e):
+        self._agent_flush_progress()
+        self.add_message("error", f"Agent error: {e}")
 
-                def _done():
-                    files_list = "\n".join([f"• {w['path']}" for w in result.get('written', [])])
-                    summary = result.get('summary', 'Done.')
-                    self.add_message("success", f"All done!\n{summary}\n\nFiles:\n{files_list}")
-            
-                self.chat_text.after(0, _done)
-            except Exception as e:
-                def _err():
-                    self.add_message("error", f"Agent error: {e}")
-                self.chat_text.after(0, _err)
-            finally:
-                def _finish():
-                    self.generating = False
-                    self.send_button.config(state='normal')
-                    self.stop_button.config(state='disabled')
-                    self.generate_project_button.config(state='normal')
-                    self.agent_builder_button.config(state='normal')
-                self.chat_text.after(0, _finish)
+    def _agent_finish(self):
+        self.generating = False
+        self.send_button.config(state='normal')
+        self.stop_button.config(state='disabled')
+        self.generate_project_button.config(state='normal')
+        self.agent_builder_button.config(state='normal')
 
-        threading.Thread(target=worker, daemon=True).start()
+    def _agent_worker(self, request: str, output_dir: str):
+        """Run the agent on the worker thread and marshal results back"""
+        try:
+            result = self.agent.run(
+                request=request,
+                output_dir=output_dir,
+                progress_cb=self._agent_progress_cb,
+                file_cb=self._agent_file_cb,
+                stop_event=self._agent_stop
+            )
+            self.chat_text.after(0, lambda: self._agent_done(result))
+        except Exception as e:
+            self.chat_text.after(0, lambda e=e: self._agent_error(e))
+        finally:
+            self.chat_text.after(0, self._agent_finish)
 
     def add_welcome_message(self):
         """Add welcome message to chat"""
@@ -352,6 +424,11 @@ Just describe your app idea and I'll start generating! 🚀"""
         else:
             self.chat_text.insert(tk.END, content + "\n\n", role)
 
+        # Evict oldest lines past the rolling limit
+        line_count = int(self.chat_text.index('end-1c').split('.')[0])
+        if line_count > self.MAX_CHAT_LINES:
+            self.chat_text.delete('1.0', f'{line_count - self.MAX_CHAT_LINES + 1}.0')
+
         self.chat_text.configure(state='disabled')
         self.chat_text.see(tk.END)
 
@@ -434,8 +511,7 @@ Just describe your app idea and I'll start generating! 🚀"""
         self.chat_text.see(tk.END)
 
         # Start generation in background
-        thread = threading.Thread(target=self._generate_worker, args=(message,), daemon=True)
-        thread.start()
+        self._submit_job(self._generate_worker, message)
 
     def _generate_worker(self, message: str):
         """Background worker for generation with real-time streaming"""
@@ -453,38 +529,53 @@ Just describe your app idea and I'll start generating! 🚀"""
 
             # Prepare for streaming response
             response_tokens = []
+            thinking_removed = [False]
+
+            def flush_tokens():
+                """Insert all buffered tokens in one widget update"""
+                with self._token_lock:
+                    self._token_flush_scheduled = False
+                    pending = ''.join(self._token_buf)
+                    self._token_buf.clear()
+
+                if not pending:
+                    return
+
+                try:
+                    self.chat_text.configure(state='normal')
+
+                    # Remove "Thinking..." on first flush
+                    if not thinking_removed[0]:
+                        thinking_removed[0] = True
+                        current_pos = self.chat_text.search("Thinking...", thinking_start)
+                        if current_pos:
+                            end_pos = f"{current_pos}+{len('Thinking...')}c"
+                            self.chat_text.delete(current_pos, end_pos)
+
+                    # Add the batched tokens
+                    self.chat_text.insert(tk.END, pending, "assistant")
+                    self.chat_text.configure(state='disabled')
+                    self.chat_text.see(tk.END)
+
+                except Exception as e:
+                    print(f"Error updating UI: {e}")
 
             def token_callback(token):
-                """Callback to handle incoming tokens in real-time"""
+                """Buffer incoming tokens; the UI repaints per batch"""
                 try:
                     if not token:
                         return
 
                     response_tokens.append(token)
 
-                    # Update UI in main thread
-                    def update_ui():
-                        try:
-                            self.chat_text.configure(state='normal')
+                    with self._token_lock:
+                        self._token_buf.append(token)
+                        schedule = not self._token_flush_scheduled
+                        if schedule:
+                            self._token_flush_scheduled = True
 
-                            # Remove "Thinking..." on first token
-                            if len(response_tokens) == 1:
-                                # Find and remove the "Thinking..." text
-                                current_pos = self.chat_text.search("Thinking...", thinking_start)
-                                if current_pos:
-                                    end_pos = f"{current_pos}+{len('Thinking...')}c"
-                                    self.chat_text.delete(current_pos, end_pos)
-
-                            # Add the new token
-                            self.chat_text.insert(tk.END, token, "assistant")
-                            self.chat_text.configure(state='disabled')
-                            self.chat_text.see(tk.END)
-
-                        except Exception as e:
-                            print(f"Error updating UI: {e}")
-
-                    # Schedule UI update in main thread
-                    self.chat_text.after(0, update_ui)
+                    if schedule:
+                        self.chat_text.after(33, flush_tokens)
 
                 except Exception as e:
                     print(f"Error in token callback: {e}")
@@ -512,6 +603,9 @@ Just describe your app idea and I'll start generating! 🚀"""
 
                 self.chat_text.after(0, show_error)
 
+            # Flush any tokens still in the buffer
+            self.chat_text.after(0, flush_tokens)
+
             # Add final timing info
             def add_timing():
                 elapsed = time.time() - start_time
@@ -537,6 +631,7 @@ Just describe your app idea and I'll start generating! 🚀"""
 
     def stop_generation(self):
         """Stop the current generation"""
+        self._agent_stop.set()
         self.llm_manager.stop_generation()
         self.add_message("system", "Generation stopped by user.")
         self.generation_finished()
@@ -587,12 +682,7 @@ Just describe your app idea and I'll start generating! 🚀"""
         self.add_message("system", f"🚀 Starting project generation: {project_name}")
 
         # Start generation in background
-        thread = threading.Thread(
-            target=self._project_generation_worker,
-            args=(project_name, output_dir),
-            daemon=True
-        )
-        thread.start()
+        self._submit_job(self._project_generation_worker, project_name, output_dir)
 
     def _project_generation_worker(self, project_name: str, output_dir: str):
         """Background worker for project generation"""
@@ -650,7 +740,7 @@ Just describe your app idea and I'll start generating! 🚀"""
         def worker():
             try:
                 # Lazy import to avoid GUI import cost
-                from core.android_builder import AndroidBuilder
+                from android_app_generator.core.android_builder import AndroidBuilder
                 builder = AndroidBuilder()
 
                 ui_step_update('sdk_check', 'Checking Android SDK/JDK/Gradle', 'start')
@@ -670,7 +760,7 @@ Just describe your app idea and I'll start generating! 🚀"""
                 ui_step_update('assemble', f"Build failed: {e}", 'error')
                 self.add_message('error', f"❌ Build failed: {e}")
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._submit_job(worker)
 
     def get_chat_history(self) -> str:
         """Extract chat history for project generation"""
@@ -727,8 +817,14 @@ Just describe your app idea and I'll start generating! 🚀"""
 
         if filename:
             try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                # Memory-map large histories instead of copying them
+                # through the buffered text layer
+                with open(filename, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size > 1 << 20:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                            content = mapped[:].decode('utf-8')
+                    else:
+                        content = f.read().decode('utf-8')
 
                 self.chat_text.configure(state='normal')
                 self.chat_text.delete("1.0", tk.END)
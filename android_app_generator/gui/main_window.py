@@ -6,8 +6,46 @@ from typing import Optional, Callable
 from .chat_panel import ChatPanel
 from .project_panel import ProjectPanel
 from .settings_panel import SettingsPanel
-from core.llm_manager import LLMManager
-from core.project_generator import ProjectGenerator
+from android_app_generator.core.llm_manager import LLMManager
+from android_app_generator.core.project_generator import ProjectGenerator
+
+# Font tuples reused across windows so repeated style setup doesn't re-tuple
+_FONT_TITLE = ('Segoe UI', 16, 'bold')
+_FONT_SUBTITLE = ('Segoe UI', 12)
+_FONT_STATUS = ('Segoe UI', 9)
+_FONT_BUTTON = ('Segoe UI', 10, 'bold')
+_FONT_TAB = ('Segoe UI', 10)
+
+# Core components are shared across window instances so a rebuilt window
+# (e.g. after a settings change) reuses the already-initialized model
+_SHARED_LLM = None
+_SHARED_GENERATOR = None
+
+
+# Emoji-capable fonts probed in order when rasterizing icon sprites
+_EMOJI_FONTS = ('seguiemj.ttf', 'AppleColorEmoji.ttf', 'NotoColorEmoji.ttf')
+
+
+def _load_emoji_font(size: int):
+    """Find an emoji-capable truetype font, or None if unavailable"""
+    try:
+        from PIL import ImageFont
+    except Exception:
+        return None
+    for name in _EMOJI_FONTS:
+        try:
+            return ImageFont.truetype(name, size)
+        except Exception:
+            continue
+    return None
+
+
+# Prompts for the quick-action buttons, built once at import time
+_QUICK_TEMPLATES = {
+    "todo": "Create a todo list app with add, edit, delete, and mark as complete functionality. Include a modern Material Design UI with RecyclerView and Room database.",
+    "weather": "Build a weather app that shows current weather conditions, 5-day forecast, and location-based weather. Use OpenWeatherMap API and include beautiful weather icons.",
+    "calculator": "Create a modern calculator app with basic arithmetic operations, scientific functions, and a clean Material Design interface."
+}
 
 
 class MainWindow:
@@ -17,12 +55,19 @@ class MainWindow:
 
     def __init__(self):
         self.root = tk.Tk()
+        # PhotoImage sprites for emoji, keyed by (char, size); Tk drops
+        # images that are garbage collected, so references live here
+        self._emoji_cache = {}
         self.setup_window()
         self.setup_styles()
 
         # Core components - create these BEFORE creating widgets
-        self.llm_manager = LLMManager()
-        self.project_generator = ProjectGenerator(self.llm_manager)
+        global _SHARED_LLM, _SHARED_GENERATOR
+        if _SHARED_LLM is None:
+            _SHARED_LLM = LLMManager()
+            _SHARED_GENERATOR = ProjectGenerator(_SHARED_LLM)
+        self.llm_manager = _SHARED_LLM
+        self.project_generator = _SHARED_GENERATOR
 
         # Now create widgets that depend on the core components
         self.create_widgets()
@@ -48,9 +93,18 @@ class MainWindow:
         self.root.grid_rowconfigure(0, weight=1)
         self.root.grid_columnconfigure(1, weight=1)
 
+    # Tcl interpreter the named styles were last configured in; styles
+    # live per interpreter, so a later window built on a fresh tk.Tk()
+    # must run the configuration again while reuse of the same root can
+    # skip the Tcl round trips
+    _styles_interp = None
+
     def setup_styles(self):
         """Configure modern ttk styles"""
-        style = ttk.Style()
+        if MainWindow._styles_interp is self.root.tk:
+            return
+
+        style = ttk.Style(self.root)
 
         # Configure theme
         try:
@@ -59,15 +113,15 @@ class MainWindow:
             pass
 
         # Custom styles
-        style.configure('Title.TLabel', font=('Segoe UI', 16, 'bold'))
-        style.configure('Subtitle.TLabel', font=('Segoe UI', 12))
-        style.configure('Status.TLabel', font=('Segoe UI', 9))
+        style.configure('Title.TLabel', font=_FONT_TITLE)
+        style.configure('Subtitle.TLabel', font=_FONT_SUBTITLE)
+        style.configure('Status.TLabel', font=_FONT_STATUS)
 
         # Button styles
         style.configure('Primary.TButton',
                         background='#0078d4',
                         foreground='white',
-                        font=('Segoe UI', 10, 'bold'))
+                        font=_FONT_BUTTON)
         style.configure('Success.TButton',
                         background='#107c10',
                         foreground='white')
@@ -77,7 +131,40 @@ class MainWindow:
 
         # Notebook style
         style.configure('TNotebook', background='#f0f0f0')
-        style.configure('TNotebook.Tab', padding=[10, 5], font=('Segoe UI', 10))
+        style.configure('TNotebook.Tab', padding=[10, 5], font=_FONT_TAB)
+
+        MainWindow._styles_interp = self.root.tk
+
+    def _emoji_icon(self, ch: str, size: int = 18):
+        """Rasterize an emoji to a PhotoImage sprite once and reuse it
+
+        Keeping emoji out of widget text lets Tk take its fast plain-text
+        layout path instead of complex-script shaping. Returns None when
+        Pillow or an emoji font is unavailable.
+        """
+        key = (ch, size)
+        if key not in self._emoji_cache:
+            icon = None
+            try:
+                from PIL import Image, ImageDraw, ImageTk
+                font = _load_emoji_font(size)
+                if font is not None:
+                    img = Image.new('RGBA', (size + 2, size + 2), (0, 0, 0, 0))
+                    ImageDraw.Draw(img).text((1, 1), ch, font=font, embedded_color=True)
+                    icon = ImageTk.PhotoImage(img)
+            except Exception:
+                icon = None
+            self._emoji_cache[key] = icon
+        return self._emoji_cache[key]
+
+    def _icon_opts(self, emoji: str, text: str, size: int = 18) -> dict:
+        """Widget options using an emoji sprite, falling back to text"""
+        icon = self._emoji_icon(emoji, size)
+        if icon is not None:
+            if not text:
+                return {'image': icon}
+            return {'image': icon, 'text': text, 'compound': 'left'}
+        return {'text': f"{emoji} {text}" if text else emoji}
 
     def create_widgets(self):
         """Create and arrange main widgets"""
@@ -97,7 +184,8 @@ class MainWindow:
         title_frame = ttk.Frame(sidebar)
         title_frame.pack(fill='x', padx=10, pady=10)
 
-        ttk.Label(title_frame, text="🤖", font=('Segoe UI', 24)).pack()
+        ttk.Label(title_frame, font=('Segoe UI', 24),
+                  **self._icon_opts("🤖", "", size=48)).pack()
         ttk.Label(title_frame, text="App Generator",
                   style='Title.TLabel').pack()
         ttk.Label(title_frame, text="AI-Powered Android Development",
@@ -107,15 +195,15 @@ class MainWindow:
         nav_frame = ttk.Frame(sidebar)
         nav_frame.pack(fill='x', padx=10, pady=10)
 
-        self.chat_btn = ttk.Button(nav_frame, text="💬 Chat & Generate",
+        self.chat_btn = ttk.Button(nav_frame, **self._icon_opts("💬", "Chat & Generate"),
                                    command=self.show_chat_panel, style='Primary.TButton')
         self.chat_btn.pack(fill='x', pady=2)
 
-        self.projects_btn = ttk.Button(nav_frame, text="📁 Projects",
+        self.projects_btn = ttk.Button(nav_frame, **self._icon_opts("📁", "Projects"),
                                        command=self.show_projects_panel)
         self.projects_btn.pack(fill='x', pady=2)
 
-        self.settings_btn = ttk.Button(nav_frame, text="⚙️ Settings",
+        self.settings_btn = ttk.Button(nav_frame, **self._icon_opts("⚙️", "Settings"),
                                        command=self.show_settings_panel)
         self.settings_btn.pack(fill='x', pady=2)
 
@@ -123,22 +211,24 @@ class MainWindow:
         quick_frame = ttk.LabelFrame(sidebar, text="Quick Actions", padding=10)
         quick_frame.pack(fill='x', padx=10, pady=10)
 
-        ttk.Button(quick_frame, text="📱 New Todo App",
+        ttk.Button(quick_frame, **self._icon_opts("📱", "New Todo App"),
                    command=lambda: self.quick_generate("todo")).pack(fill='x', pady=1)
-        ttk.Button(quick_frame, text="🌤️ New Weather App",
+        ttk.Button(quick_frame, **self._icon_opts("🌤️", "New Weather App"),
                    command=lambda: self.quick_generate("weather")).pack(fill='x', pady=1)
-        ttk.Button(quick_frame, text="🧮 New Calculator",
+        ttk.Button(quick_frame, **self._icon_opts("🧮", "New Calculator"),
                    command=lambda: self.quick_generate("calculator")).pack(fill='x', pady=1)
 
         # Status section
         status_frame = ttk.LabelFrame(sidebar, text="Status", padding=10)
         status_frame.pack(fill='x', padx=10, pady=(10, 0))
 
-        self.model_status = ttk.Label(status_frame, text="🔴 Model: Not Loaded",
+        self._model_status_var = tk.StringVar(value="🔴 Model: Not Loaded")
+        self.model_status = ttk.Label(status_frame, textvariable=self._model_status_var,
                                       style='Status.TLabel')
         self.model_status.pack(anchor='w')
 
-        self.generation_status = ttk.Label(status_frame, text="⚪ Generation: Idle",
+        self._generation_status_var = tk.StringVar(value="⚪ Generation: Idle")
+        self.generation_status = ttk.Label(status_frame, textvariable=self._generation_status_var,
                                            style='Status.TLabel')
         self.generation_status.pack(anchor='w')
 
@@ -147,19 +237,41 @@ class MainWindow:
         self.notebook = ttk.Notebook(self.root)
         self.notebook.grid(row=0, column=1, sticky='nsew', padx=2, pady=2)
 
-        # Create panels
+        # Only the visible tab is built up front; the other panels are
+        # placeholders materialized on first visit to keep startup fast
         self.chat_panel = ChatPanel(self.notebook, self.llm_manager, self.project_generator)
-        self.projects_panel = ProjectPanel(self.notebook)
-        self.settings_panel = SettingsPanel(self.notebook, self.llm_manager)
+        self.projects_panel = None
+        self.settings_panel = None
 
-        # Add panels to notebook
         self.notebook.add(self.chat_panel, text="💬 Chat & Generate")
-        self.notebook.add(self.projects_panel, text="📁 Projects")
-        self.notebook.add(self.settings_panel, text="⚙️ Settings")
+        self.notebook.add(ttk.Frame(self.notebook), text="📁 Projects")
+        self.notebook.add(ttk.Frame(self.notebook), text="⚙️ Settings")
+
+        self._built_tabs = {0}
 
         # Bind notebook events
         self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
 
+    def build_tab(self, tab_id: int):
+        """Create a deferred panel the first time its tab is selected"""
+        if tab_id in self._built_tabs:
+            return
+
+        if tab_id == 1:
+            panel = self.projects_panel = ProjectPanel(self.notebook)
+            caption = "📁 Projects"
+        elif tab_id == 2:
+            panel = self.settings_panel = SettingsPanel(self.notebook, self.llm_manager)
+            caption = "⚙️ Settings"
+        else:
+            return
+
+        placeholder = self.notebook.tabs()[tab_id]
+        self.notebook.insert(tab_id, panel, text=caption)
+        self.notebook.forget(placeholder)
+        self._built_tabs.add(tab_id)
+        self.notebook.select(tab_id)
+
     def setup_menu(self):
         """Create application menu bar"""
         menubar = tk.Menu(self.root)
@@ -173,26 +285,37 @@ class MainWindow:
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.root.quit)
 
-        # Tools menu
-        tools_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Tools", menu=tools_menu)
-        tools_menu.add_command(label="Model Manager", command=self.open_model_manager)
-        tools_menu.add_command(label="Template Editor", command=self.open_template_editor)
-        tools_menu.add_separator()
-        tools_menu.add_command(label="Batch Generator", command=self.open_batch_generator)
-
-        # Help menu
-        help_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Help", menu=help_menu)
-        help_menu.add_command(label="Documentation", command=self.show_documentation)
-        help_menu.add_command(label="About", command=self.show_about)
+        # Tools and Help menus are populated just-in-time on first post;
+        # most sessions never open them
+        self._tools_menu = tk.Menu(menubar, tearoff=0, postcommand=self._populate_tools_menu)
+        menubar.add_cascade(label="Tools", menu=self._tools_menu)
+
+        self._help_menu = tk.Menu(menubar, tearoff=0, postcommand=self._populate_help_menu)
+        menubar.add_cascade(label="Help", menu=self._help_menu)
+
+    def _populate_tools_menu(self):
+        """Fill the Tools menu the first time it is posted"""
+        if self._tools_menu.index('end') is not None:
+            return
+        self._tools_menu.add_command(label="Model Manager", command=self.open_model_manager)
+        self._tools_menu.add_command(label="Template Editor", command=self.open_template_editor)
+        self._tools_menu.add_separator()
+        self._tools_menu.add_command(label="Batch Generator", command=self.open_batch_generator)
+
+    def _populate_help_menu(self):
+        """Fill the Help menu the first time it is posted"""
+        if self._help_menu.index('end') is not None:
+            return
+        self._help_menu.add_command(label="Documentation", command=self.show_documentation)
+        self._help_menu.add_command(label="About", command=self.show_about)
 
     def setup_status_bar(self):
         """Create status bar at bottom"""
         status_bar = ttk.Frame(self.root, relief='sunken', borderwidth=1)
         status_bar.grid(row=1, column=0, columnspan=2, sticky='ew', padx=2, pady=2)
 
-        self.status_label = ttk.Label(status_bar, text="Ready", style='Status.TLabel')
+        self._status_var = tk.StringVar(value="Ready")
+        self.status_label = ttk.Label(status_bar, textvariable=self._status_var, style='Status.TLabel')
         self.status_label.pack(side='left', padx=5)
 
         # Create progress bar but don't start it automatically
@@ -202,20 +325,29 @@ class MainWindow:
 
     def initialize_components(self):
         """Initialize core components"""
+        # The shared manager survives window rebuilds; skip the worker
+        # thread entirely when the model is already loaded
+        if self.llm_manager.is_ready():
+            self.update_model_status("🟢 Model: Loaded")
+            self.update_status("Ready")
+            return
 
         def init_worker():
+            # Runs off the UI thread: marshal every widget touch through
+            # after(0, ...) so only the main thread talks to Tk
             try:
-                self.update_status("Initializing AI model...")
+                self.root.after(0, self.update_status, "Initializing AI model...")
                 success = self.llm_manager.initialize()
                 if success:
-                    self.update_model_status("🟢 Model: Loaded")
-                    self.update_status("Ready")
+                    self.root.after(0, self.update_model_status, "🟢 Model: Loaded")
+                    self.root.after(0, self.update_status, "Ready")
                 else:
-                    self.update_model_status("🟡 Model: Not Loaded")
-                    self.update_status("Ready - Model not loaded. Use Settings to download.")
+                    self.root.after(0, self.update_model_status, "🟡 Model: Not Loaded")
+                    self.root.after(0, self.update_status,
+                                    "Ready - Model not loaded. Use Settings to download.")
             except Exception as e:
-                self.update_model_status("🔴 Model: Error")
-                self.update_status(f"Error: {str(e)}")
+                self.root.after(0, self.update_model_status, "🔴 Model: Error")
+                self.root.after(0, self.update_status, f"Error: {str(e)}")
                 print(f"Initialization error: {e}")
                 # Don't show error dialog during startup to avoid blocking the UI
 
@@ -240,6 +372,9 @@ class MainWindow:
         current_tab = self.notebook.select()
         tab_id = self.notebook.index(current_tab)
 
+        # Build lazily-created panels on first visit
+        self.build_tab(tab_id)
+
         if tab_id == 0:  # Chat panel
             self.update_status("Chat & Generate - Describe your app idea")
         elif tab_id == 1:  # Projects panel
@@ -249,29 +384,27 @@ class MainWindow:
 
     def quick_generate(self, app_type: str):
         """Quick generate common app types"""
-        templates = {
-            "todo": "Create a todo list app with add, edit, delete, and mark as complete functionality. Include a modern Material Design UI with RecyclerView and Room database.",
-            "weather": "Build a weather app that shows current weather conditions, 5-day forecast, and location-based weather. Use OpenWeatherMap API and include beautiful weather icons.",
-            "calculator": "Create a modern calculator app with basic arithmetic operations, scientific functions, and a clean Material Design interface."
-        }
+        prompt = _QUICK_TEMPLATES.get(app_type)
+        if prompt is None:
+            return
 
-        if app_type in templates:
-            self.show_chat_panel()
-            self.chat_panel.set_prompt(templates[app_type])
-            self.update_status(f"Quick generating {app_type} app...")
+        self.show_chat_panel()
+        self.chat_panel.set_prompt(prompt)
+        self.update_status(f"Quick generating {app_type} app...")
 
     def update_status(self, message: str):
         """Update status bar message"""
-        self.status_label.config(text=message)
-        self.root.update_idletasks()
+        # The bound StringVar is picked up at the next natural idle cycle,
+        # so no forced update_idletasks flush is needed
+        self._status_var.set(message)
 
     def update_model_status(self, status: str):
         """Update model status in sidebar"""
-        self.model_status.config(text=status)
+        self._model_status_var.set(status)
 
     def update_generation_status(self, status: str):
         """Update generation status in sidebar"""
-        self.generation_status.config(text=status)
+        self._generation_status_var.set(status)
 
     def show_progress(self, show: bool = True):
         """Show/hide progress bar"""
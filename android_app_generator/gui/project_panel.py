@@ -0,0 +1,645 @@
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+import os
+import re
+import sys
+import json
+import shutil
+import subprocess
+import threading
+import time
+from typing import List, Dict, Any
+
+# Optional fast JSON encoder; fall back to compact stdlib encoding
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except Exception:  # pragma: no cover - environment without orjson
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+# Characters with special meaning inside a Tcl double-quoted word
+_TCL_SPECIALS = re.compile(r'([\\\[\]$"])')
+
+
+def _tcl_quote(value: Any) -> str:
+    """Quote a value so Tcl parses it back as a single literal word
+
+    The value is wrapped in double quotes (so empty strings and
+    whitespace — including newlines — stay one word) with the few
+    characters that are still special inside quotes backslash-escaped.
+    """
+    return '"' + _TCL_SPECIALS.sub(r'\\\1', str(value)) + '"'
+
+
+# Platform dispatch resolved once at import time instead of per call
+def _win_open(path):
+    os.startfile(path)
+
+
+def _mac_open(path):
+    subprocess.Popen(['open', path])
+
+
+def _xdg_open(path):
+    subprocess.Popen(['xdg-open', path])
+
+
+_OPEN_CMD = {'win32': _win_open, 'darwin': _mac_open}.get(sys.platform, _xdg_open)
+_STUDIO_LAUNCHER = 'studio64.exe' if sys.platform == 'win32' else 'studio.sh'
+_DETACH_KWARGS = ({'creationflags': subprocess.DETACHED_PROCESS}
+                  if sys.platform == 'win32' else {'start_new_session': True})
+
+
+class ProjectPanel(ttk.Frame):
+    """
+    Panel for managing generated Android projects
+    """
+    
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.projects = []
+        self.projects_file = "projects.json"
+        # Path -> project dict index for O(1) lookups on add/select/delete
+        self._by_path = {}
+        # Treeview rows keyed by project path (used as the item iid) so
+        # refreshes only touch rows that actually changed
+        self._row_by_path = {}
+        self._row_values = {}
+        # Short-lived os.path.exists cache so rapid successive refreshes
+        # don't re-stat every project path on the UI thread
+        self._exists_cache = {}
+        # Pending after() id for the debounced projects.json flush
+        self._save_after_id = None
+        # Index of the first project rendered in the virtualized Treeview
+        self._scroll_offset = 0
+        # Row count the window was last rendered with, so resizes that
+        # change how many rows fit trigger a re-render
+        self._last_visible_rows = 0
+
+        self.setup_ui()
+        self.load_projects()
+
+        # Debouncing must not lose the last write: flush any pending
+        # save when the panel is torn down with the app
+        self.bind('<Destroy>', self._on_panel_destroy)
+
+    def _on_panel_destroy(self, event):
+        """Flush a pending debounced save before the widget goes away"""
+        if event.widget is not self or self._save_after_id is None:
+            return
+        try:
+            self.after_cancel(self._save_after_id)
+        except Exception:
+            pass
+        self._save_after_id = None
+        self._flush_save()
+        
+    def setup_ui(self):
+        """Setup the user interface"""
+        # Configure grid weights
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+        
+        # Top toolbar
+        self.create_toolbar()
+        
+        # Projects list
+        self.create_projects_list()
+        
+        # Bottom status
+        self.create_status_bar()
+        
+    def create_toolbar(self):
+        """Create top toolbar with controls"""
+        toolbar = ttk.Frame(self)
+        toolbar.grid(row=0, column=0, sticky='ew', padx=5, pady=5)
+        
+        # Left side - Title
+        title_frame = ttk.Frame(toolbar)
+        title_frame.pack(side='left', fill='x', expand=True)
+        
+        ttk.Label(title_frame, text="📁 Generated Projects", 
+                 font=('Segoe UI', 14, 'bold')).pack(side='left')
+        
+        # Right side - Controls
+        controls_frame = ttk.Frame(toolbar)
+        controls_frame.pack(side='right')
+        
+        ttk.Button(controls_frame, text="🔄 Refresh", 
+                  command=self.refresh_projects).pack(side='left', padx=2)
+        ttk.Button(controls_frame, text="📂 Open Folder", 
+                  command=self.open_projects_folder).pack(side='left', padx=2)
+        ttk.Button(controls_frame, text="🗑️ Clear History", 
+                  command=self.clear_history).pack(side='left', padx=2)
+        
+    def create_projects_list(self):
+        """Create the projects list view"""
+        # Projects container
+        projects_container = ttk.Frame(self)
+        projects_container.grid(row=1, column=0, sticky='nsew', padx=5, pady=5)
+        projects_container.grid_rowconfigure(0, weight=1)
+        projects_container.grid_columnconfigure(0, weight=1)
+        
+        # Create Treeview for projects
+        columns = ('Name', 'Path', 'Date', 'Status')
+        self.projects_tree = ttk.Treeview(projects_container, columns=columns, show='headings', height=15)
+        
+        # Configure columns
+        self.projects_tree.heading('Name', text='Project Name')
+        self.projects_tree.heading('Path', text='Location')
+        self.projects_tree.heading('Date', text='Created')
+        self.projects_tree.heading('Status', text='Status')
+        
+        self.projects_tree.column('Name', width=200)
+        self.projects_tree.column('Path', width=300)
+        self.projects_tree.column('Date', width=150)
+        self.projects_tree.column('Status', width=100)
+        
+        # Add scrollbars; the vertical one drives the virtual window rather
+        # than the Treeview's own yview, since only visible rows are inserted
+        self.tree_scroll_y = ttk.Scrollbar(projects_container, orient='vertical', command=self._on_scrollbar)
+        tree_scroll_x = ttk.Scrollbar(projects_container, orient='horizontal', command=self.projects_tree.xview)
+        self.projects_tree.configure(xscrollcommand=tree_scroll_x.set)
+
+        # Grid layout
+        self.projects_tree.grid(row=0, column=0, sticky='nsew')
+        self.tree_scroll_y.grid(row=0, column=1, sticky='ns')
+        tree_scroll_x.grid(row=1, column=0, sticky='ew')
+
+        # Bind events
+        self.projects_tree.bind('<Double-1>', self.on_project_double_click)
+        self.projects_tree.bind('<Button-3>', self.show_context_menu)
+        self.projects_tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.projects_tree.bind('<Button-4>', self._on_mousewheel)
+        self.projects_tree.bind('<Button-5>', self._on_mousewheel)
+        self.projects_tree.bind('<Configure>', self._on_tree_configure)
+        
+        # Right-click context menu is built lazily on first use
+        self.context_menu = None
+
+    def create_status_bar(self):
+        """Create status bar at bottom"""
+        status_frame = ttk.Frame(self)
+        status_frame.grid(row=2, column=0, sticky='ew', padx=5, pady=5)
+        
+        self.status_label = ttk.Label(status_frame, text="Ready")
+        self.status_label.pack(side='left')
+        
+        # Project count
+        self.project_count_label = ttk.Label(status_frame, text="0 projects")
+        self.project_count_label.pack(side='right')
+        
+    def load_projects(self):
+        """Load projects from JSON file on a worker thread"""
+        def worker():
+            try:
+                if os.path.exists(self.projects_file):
+                    with open(self.projects_file, 'r') as f:
+                        projects = json.load(f)
+                else:
+                    projects = []
+
+                self.after(0, self._apply_loaded, projects)
+
+            except Exception as e:
+                self.after(0, self._on_load_error, str(e))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _apply_loaded(self, projects: List[Dict[str, Any]]):
+        """Apply projects loaded off-thread (runs on the UI thread)"""
+        for project in projects:
+            project['_row'] = (project['name'], project['path'],
+                               project.get('date', 'Unknown'))
+        self.projects = projects
+        self._by_path = {p['path']: p for p in projects}
+        self._exists_cache.clear()
+        self.refresh_projects_list()
+
+    def _on_load_error(self, message: str):
+        """Report a failed load (runs on the UI thread)"""
+        messagebox.showerror("Error", f"Failed to load projects: {message}")
+        self.projects = []
+        self._by_path = {}
+        self.refresh_projects_list()
+
+
+    def save_projects(self):
+        """Save projects to JSON file immediately"""
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._flush_save()
+
+    def _schedule_save(self):
+        """Coalesce bursts of mutations into one deferred write"""
+        if self._save_after_id is None:
+            self._save_after_id = self.after(250, self._flush_save)
+
+    def _flush_save(self):
+        """Write projects to disk atomically via a temp file"""
+        self._save_after_id = None
+        try:
+            # The cached '_row' display tuple is UI-only state
+            payload = _dumps([{k: v for k, v in p.items() if k != '_row'}
+                              for p in self.projects])
+            tmp = self.projects_file + '.tmp'
+            with open(tmp, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp, self.projects_file)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save projects: {str(e)}")
+
+
+    def _exists(self, path: str, ttl: float = 2.0) -> bool:
+        """os.path.exists with a short TTL cache to avoid per-refresh syscalls"""
+        now = time.monotonic()
+        cached = self._exists_cache.get(path)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+
+        exists = os.path.exists(path)
+        self._exists_cache[path] = (now, exists)
+        return exists
+
+    # Extra off-screen rows kept inserted below the visible window
+    _SCROLL_BUFFER = 10
+
+    def refresh_projects_list(self):
+        """Refresh the rendered window of the projects list
+
+        Only the rows inside the current scroll window (plus a small
+        buffer) are kept in the Treeview, so refresh cost stays constant
+        regardless of how many projects exist. Rows are diffed by project
+        path so unchanged ones are not touched.
+        """
+        self._scroll_offset = min(self._scroll_offset, self._max_offset())
+        self._last_visible_rows = self._visible_row_count()
+        window = self.projects[self._scroll_offset:
+                               self._scroll_offset + self._last_visible_rows + self._SCROLL_BUFFER]
+
+        # Compute the target row values keyed by project path; the base
+        # tuple is precomputed at mutation time, only the existence
+        # status is appended here
+        target = {}
+        for project in window:
+            # Check if project still exists
+            exists = self._exists(project['path'])
+            status = "✅ Exists" if exists else "❌ Missing"
+
+            target[project['path']] = project['_row'] + (status,)
+
+        removed = [path for path in self._row_values if path not in target]
+        added = [path for path in target if path not in self._row_by_path]
+
+        def apply_changes():
+            # Remove rows that scrolled out of the window or disappeared
+            for path in removed:
+                self.projects_tree.delete(self._row_by_path.pop(path))
+                del self._row_values[path]
+
+            # Update rows whose values changed, collecting new rows for
+            # one batched insert
+            new_rows = []
+            for path, values in target.items():
+                if path not in self._row_by_path:
+                    new_rows.append((path, values))
+                elif self._row_values[path] != values:
+                    self.projects_tree.item(self._row_by_path[path], values=values)
+                    self._row_values[path] = values
+
+            if new_rows:
+                self._bulk_insert(new_rows)
+
+            # Enforce window order (new rows were appended at the end)
+            for index, path in enumerate(target):
+                self.projects_tree.move(self._row_by_path[path], '', index)
+
+        # Detach the widget during large rewrites so Tk doesn't paint
+        # intermediate states
+        if len(removed) + len(added) > 10:
+            self._with_frozen_tree(apply_changes)
+        else:
+            apply_changes()
+
+        # Update status
+        self.project_count_label.config(text=f"{len(self.projects)} projects")
+        self._update_scrollbar()
+
+    def _with_frozen_tree(self, fn):
+        """Run fn with the Treeview detached, a Freeze/Thaw equivalent
+
+        grid_remove keeps the grid options, so re-attaching restores the
+        original layout; selection recomputation is also disabled for
+        the duration of the mutation.
+        """
+        self.projects_tree.grid_remove()
+        self.projects_tree.configure(selectmode='none')
+        try:
+            fn()
+        finally:
+            self.projects_tree.configure(selectmode='extended')
+            self.projects_tree.grid()
+
+    def _bulk_insert(self, rows):
+        """Insert many Treeview rows with a single Tcl eval
+
+        Each .insert() call is a Python->Tcl round trip; joining the
+        insert commands into one eval amortizes that overhead on bulk
+        loads. Arguments are backslash-escaped so paths with spaces or
+        braces stay intact.
+        """
+        tree = str(self.projects_tree)
+        cmds = []
+        for path, values in rows:
+            values_q = ' '.join(_tcl_quote(v) for v in values)
+            cmds.append(f'{tree} insert {{}} end -id {_tcl_quote(path)} -values [list {values_q}]')
+        self.projects_tree.tk.eval('\n'.join(cmds))
+
+        for path, values in rows:
+            self._row_by_path[path] = path
+            self._row_values[path] = values
+
+    def _visible_row_count(self) -> int:
+        """Number of rows that fit the Treeview's current pixel height
+
+        The widget is gridded with weight so it stretches past its
+        configured row height; the virtual window has to track the real
+        size, not the construction option.
+        """
+        try:
+            pixels = self.projects_tree.winfo_height()
+            if pixels > 1:  # winfo_height is 1 until first mapped
+                row_px = self._row_height()
+                # One row's worth of pixels goes to the heading line
+                return max((pixels - row_px) // row_px, 1)
+            return max(int(self.projects_tree.cget('height')), 1)
+        except Exception:
+            return 15
+
+    def _row_height(self) -> int:
+        """Pixel height of one Treeview row per the active style"""
+        try:
+            return int(ttk.Style(self).lookup('Treeview', 'rowheight') or 20)
+        except Exception:
+            return 20
+
+    def _on_tree_configure(self, event=None):
+        """Re-render when a resize changes how many rows fit"""
+        visible = self._visible_row_count()
+        if visible != self._last_visible_rows:
+            self.refresh_projects_list()
+        else:
+            self._update_scrollbar()
+
+    def _max_offset(self) -> int:
+        return max(len(self.projects) - self._visible_row_count(), 0)
+
+    def _set_offset(self, offset: int):
+        """Scroll the virtual window to the given first-row index"""
+        offset = max(0, min(int(offset), self._max_offset()))
+        if offset != self._scroll_offset:
+            self._scroll_offset = offset
+            self.refresh_projects_list()
+        else:
+            self._update_scrollbar()
+
+    def _update_scrollbar(self):
+        """Report the virtual window position to the scrollbar"""
+        total = len(self.projects)
+        if total <= 0:
+            self.tree_scroll_y.set(0.0, 1.0)
+            return
+        first = self._scroll_offset / total
+        last = min((self._scroll_offset + self._visible_row_count()) / total, 1.0)
+        self.tree_scroll_y.set(first, last)
+
+    def _on_scrollbar(self, action, amount, units=None):
+        """Scrollbar callback translating to virtual-window offsets"""
+        if action == 'moveto':
+            # The fraction is thumb-top over the whole list; _set_offset
+            # clamps the tail so the last page stays fully populated
+            self._set_offset(round(float(amount) * len(self.projects)))
+        elif action == 'scroll':
+            step = int(amount)
+            if units == 'pages':
+                step *= self._visible_row_count()
+            self._set_offset(self._scroll_offset + step)
+
+    def _on_mousewheel(self, event):
+        """Scroll the virtual window with the mouse wheel"""
+        if getattr(event, 'num', 0) == 4 or getattr(event, 'delta', 0) > 0:
+            self._set_offset(self._scroll_offset - 3)
+        else:
+            self._set_offset(self._scroll_offset + 3)
+        return 'break'
+        
+    def add_project(self, project_info: Dict[str, Any]):
+        """Add a new project to the list"""
+        # Check if project already exists
+        if project_info['project_path'] in self._by_path:
+            return
+
+        # Add new project
+        new_project = {
+            'name': project_info['project_name'],
+            'path': project_info['project_path'],
+            'date': project_info.get('timestamp', ''),
+            'config': project_info.get('config', {})
+        }
+        new_project['_row'] = (new_project['name'], new_project['path'],
+                               new_project['date'])
+
+        self.projects.append(new_project)
+        self._by_path[new_project['path']] = new_project
+        self._exists_cache.pop(new_project['path'], None)
+        self._schedule_save()
+        self.refresh_projects_list()
+        
+    def refresh_projects(self):
+        """Refresh the projects list"""
+        self.load_projects()
+        self.status_label.config(text="Projects refreshed")
+        
+    def open_projects_folder(self):
+        """Open the projects folder in file explorer"""
+        if self.projects:
+            # Open the folder of the first project
+            project_dir = os.path.dirname(self.projects[0]['path'])
+            self.open_folder(project_dir)
+        else:
+            # Open default projects directory
+            default_dir = os.path.join(os.path.expanduser("~"), "AndroidProjects")
+            os.makedirs(default_dir, exist_ok=True)
+            self.open_folder(default_dir)
+            
+    def open_folder(self, path: str):
+        """Open folder in system file explorer without blocking the UI"""
+        try:
+            _OPEN_CMD(path)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to open folder: {str(e)}")
+            
+    def clear_history(self):
+        """Clear project history"""
+        if messagebox.askyesno("Clear History",
+                              "Are you sure you want to clear the project history? This will not delete the actual projects."):
+            self.projects = []
+            self._by_path = {}
+            self.save_projects()
+            self.refresh_projects_list()
+            self.status_label.config(text="History cleared")
+            
+    def on_project_double_click(self, event):
+        """Handle double-click on project"""
+        selection = self.projects_tree.selection()
+        if selection:
+            self.open_in_android_studio(selection[0])
+            
+    def show_context_menu(self, event):
+        """Show context menu for right-click, building it on first use"""
+        selection = self.projects_tree.selection()
+        if not selection:
+            return
+
+        if self.context_menu is None:
+            self.context_menu = tk.Menu(self, tearoff=0)
+            self.context_menu.add_command(label="Open in Android Studio", command=self.open_in_android_studio)
+            self.context_menu.add_command(label="Open in File Explorer", command=self.open_in_file_explorer)
+            self.context_menu.add_command(label="Copy Path", command=self.copy_project_path)
+            self.context_menu.add_separator()
+            self.context_menu.add_command(label="Delete Project", command=self.delete_project)
+
+        self.context_menu.post(event.x_root, event.y_root)
+            
+    def get_selected_project(self) -> Dict[str, Any]:
+        """Get the currently selected project"""
+        selection = self.projects_tree.selection()
+        if selection:
+            # The Treeview iid is the project path, so this is an O(1) lookup
+            return self._by_path.get(selection[0])
+        return None
+        
+    # Resolved Android Studio launcher, shared across panels
+    _studio_cmd = None
+
+    def _find_studio(self) -> str:
+        """Locate the Android Studio launcher once and cache it"""
+        if ProjectPanel._studio_cmd is None:
+            ProjectPanel._studio_cmd = shutil.which(_STUDIO_LAUNCHER) or ''
+        return ProjectPanel._studio_cmd
+
+    def open_in_android_studio(self, project_path: str = None):
+        """Open project in Android Studio"""
+        if not project_path:
+            project = self.get_selected_project()
+            if not project:
+                messagebox.showwarning("Warning", "Please select a project first.")
+                return
+            project_path = project['path']
+            
+        if not os.path.exists(project_path):
+            messagebox.showerror("Error", "Project directory does not exist.")
+            return
+            
+        try:
+            # Try to open with Android Studio, detached so Tk isn't
+            # waiting on the IDE's slow launch
+            studio = self._find_studio()
+            if studio:
+                subprocess.Popen([studio, project_path], **_DETACH_KWARGS)
+            else:
+                # Fallback to opening the folder
+                self.open_folder(project_path)
+
+            self.status_label.config(text=f"Opening {os.path.basename(project_path)} in Android Studio")
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to open Android Studio: {str(e)}\n\nPlease open the project manually.")
+            
+    def open_in_file_explorer(self):
+        """Open project folder in file explorer"""
+        project = self.get_selected_project()
+        if not project:
+            messagebox.showwarning("Warning", "Please select a project first.")
+            return
+            
+        project_path = project['path']
+        if not os.path.exists(project_path):
+            messagebox.showerror("Error", "Project directory does not exist.")
+            return
+            
+        self.open_folder(project_path)
+        self.status_label.config(text=f"Opened {project['name']} folder")
+        
+    def copy_project_path(self):
+        """Copy project path to clipboard"""
+        project = self.get_selected_project()
+        if not project:
+            messagebox.showwarning("Warning", "Please select a project first.")
+            return
+            
+        try:
+            self.clipboard_clear()
+            self.clipboard_append(project['path'])
+            self.status_label.config(text="Project path copied to clipboard")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to copy path: {str(e)}")
+            
+    def delete_project(self):
+        """Delete project from list and optionally from disk"""
+        project = self.get_selected_project()
+        if not project:
+            messagebox.showwarning("Warning", "Please select a project first.")
+            return
+            
+        # Ask user what to delete
+        choice = messagebox.askyesnocancel(
+            "Delete Project",
+            f"Do you want to delete '{project['name']}'?\n\n"
+            "Yes = Delete from disk and list\n"
+            "No = Remove from list only\n"
+            "Cancel = Cancel operation"
+        )
+        
+        if choice is None:  # Cancel
+            return
+
+        if choice:  # Delete from disk on a worker thread; the tree walk
+            # for a generated project (build/ etc.) can take seconds
+            self.status_label.config(text=f"Deleting {project['name']} from disk...")
+            threading.Thread(target=self._do_rmtree, args=(project,), daemon=True).start()
+            return
+
+        # Only remove from list
+        self._remove_from_list(project)
+        self.status_label.config(text=f"Removed {project['name']} from list")
+
+    def _do_rmtree(self, project: Dict[str, Any]):
+        """Delete a project tree off the UI thread"""
+        try:
+            shutil.rmtree(project['path'])
+        except Exception as e:
+            self.after(0, self._on_rmtree_error, str(e))
+        else:
+            self.after(0, self._on_rmtree_done, project)
+
+    def _on_rmtree_done(self, project: Dict[str, Any]):
+        """Finish a disk deletion (runs on the UI thread)"""
+        self._remove_from_list(project)
+        self.status_label.config(text=f"Deleted {project['name']} from disk")
+
+    def _on_rmtree_error(self, message: str):
+        """Report a failed disk deletion (runs on the UI thread)"""
+        self.status_label.config(text="Ready")
+        messagebox.showerror("Error", f"Failed to delete project: {message}")
+
+    def _remove_from_list(self, project: Dict[str, Any]):
+        """Drop a project from the list, indexes and saved history"""
+        self.projects = [p for p in self.projects if p['path'] != project['path']]
+        self._by_path.pop(project['path'], None)
+        self._exists_cache.pop(project['path'], None)
+        self._schedule_save()
+        self.refresh_projects_list()
\ No newline at end of file
@@ -1,9 +1,24 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import copy
 import json
 import os
+import subprocess
+import sys
+import time
 from typing import Dict, Any
-from core.llm_manager import LLMManager
+from android_app_generator.core.llm_manager import LLMManager
+
+# Optional fast JSON encoder; fall back to stdlib, keeping the indented
+# layout so settings.json stays hand-editable
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except Exception:  # pragma: no cover - environment without orjson
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
 
 
 class SettingsPanel(ttk.Frame):
@@ -11,42 +26,129 @@ class SettingsPanel(ttk.Frame):
     Settings panel for configuring the application
     """
 
+    # Declarative mapping of Tk variables to their settings slots, shared
+    # by update_ui_from_settings and apply_settings
+    _VAR_MAP = (
+        ('model_path_var', 'model', 'path'),
+        ('max_tokens_var', 'model', 'max_tokens'),
+        ('temperature_var', 'model', 'temperature'),
+        ('top_p_var', 'model', 'top_p'),
+        ('repeat_penalty_var', 'model', 'repeat_penalty'),
+        ('output_dir_var', 'project', 'output_directory'),
+        ('min_sdk_var', 'project', 'min_sdk'),
+        ('target_sdk_var', 'project', 'target_sdk'),
+        ('compile_sdk_var', 'project', 'compile_sdk'),
+        ('language_var', 'project', 'language'),
+        ('theme_var', 'ui', 'theme'),
+        ('font_size_var', 'ui', 'font_size'),
+        ('remember_size_var', 'ui', 'remember_size'),
+        ('auto_save_var', 'ui', 'auto_save'),
+        ('memory_limit_var', 'advanced', 'memory_limit'),
+        ('thread_count_var', 'advanced', 'thread_count'),
+        ('enable_logging_var', 'advanced', 'enable_logging'),
+        ('show_debug_var', 'advanced', 'show_debug'),
+    )
+
     def __init__(self, parent, llm_manager: LLMManager):
         super().__init__(parent)
         self.llm_manager = llm_manager
         self.settings_file = "settings.json"
         self.settings = self.load_default_settings()
+        # (timestamp, is_ready) cache so repeated status refreshes don't
+        # re-poll the model backend
+        self._status_cache = (0.0, None)
 
         self.setup_ui()
         self.load_settings()
 
+        # Snapshot the settings whenever the panel becomes visible so
+        # Cancel can revert in memory without re-reading the file
+        self._settings_snapshot = copy.deepcopy(self.settings)
+        self.bind('<Map>', self._snapshot_settings)
+
+    def _snapshot_settings(self, event=None):
+        """Remember the current settings as the Cancel baseline"""
+        self._settings_snapshot = copy.deepcopy(self.settings)
+
     def setup_ui(self):
         """Setup the user interface"""
         # Configure grid weights
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(1, weight=1)
 
+        # Tk variables are needed before any tab widgets exist
+        self.create_variables()
+
         # Create notebook for different settings categories
         self.create_settings_notebook()
 
         # Bottom buttons
         self.create_bottom_buttons()
 
+    def create_variables(self):
+        """Create the Tk variables backing the settings controls
+
+        The variables are cheap and are read/written by
+        update_ui_from_settings and apply_settings even when a tab's
+        widgets have not been built yet, so they are created eagerly
+        while the widgets themselves are built lazily per tab.
+        """
+        self.model_path_var = tk.StringVar()
+        self.max_tokens_var = tk.IntVar(value=2048)
+        self.temperature_var = tk.DoubleVar(value=0.1)
+        self.top_p_var = tk.DoubleVar(value=0.95)
+        self.repeat_penalty_var = tk.DoubleVar(value=1.1)
+        self.output_dir_var = tk.StringVar()
+        self.min_sdk_var = tk.IntVar(value=24)
+        self.target_sdk_var = tk.IntVar(value=34)
+        self.compile_sdk_var = tk.IntVar(value=34)
+        self.language_var = tk.StringVar(value="Kotlin")
+        self.theme_var = tk.StringVar(value="System")
+        self.font_size_var = tk.IntVar(value=10)
+        self.remember_size_var = tk.BooleanVar(value=True)
+        self.auto_save_var = tk.BooleanVar(value=True)
+        self.memory_limit_var = tk.IntVar(value=2048)
+        self.thread_count_var = tk.IntVar(value=4)
+        self.enable_logging_var = tk.BooleanVar(value=False)
+        self.show_debug_var = tk.BooleanVar(value=False)
+
     def create_settings_notebook(self):
-        """Create notebook with different settings tabs"""
+        """Create notebook with lazily-built settings tabs"""
         self.notebook = ttk.Notebook(self)
         self.notebook.grid(row=0, column=0, columnspan=2, sticky='nsew', padx=5, pady=5)
 
-        # Create tabs
-        self.create_model_settings_tab()
-        self.create_project_settings_tab()
-        self.create_ui_settings_tab()
-        self.create_advanced_settings_tab()
+        # Tabs are added as empty frames; each builder fills its frame on
+        # the tab's first selection
+        self._tab_builders = {}
+        tabs = (
+            ("🤖 AI Model", self.create_model_settings_tab),
+            ("📱 Project", self.create_project_settings_tab),
+            ("🎨 Interface", self.create_ui_settings_tab),
+            ("⚙️ Advanced", self.create_advanced_settings_tab),
+        )
+        for index, (caption, builder) in enumerate(tabs):
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=caption)
+            self._tab_builders[index] = (builder, frame)
+
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+
+        # The visible tab is built immediately
+        self._build_tab(0)
+
+    def _build_tab(self, index: int):
+        """Run a deferred tab builder the first time its tab is shown"""
+        pending = self._tab_builders.pop(index, None)
+        if pending:
+            builder, frame = pending
+            builder(frame)
 
-    def create_model_settings_tab(self):
+    def _on_tab_changed(self, event):
+        """Build lazily-created tabs on first selection"""
+        self._build_tab(self.notebook.index(self.notebook.select()))
+
+    def create_model_settings_tab(self, model_frame):
         """Create model settings tab"""
-        model_frame = ttk.Frame(self.notebook)
-        self.notebook.add(model_frame, text="🤖 AI Model")
 
         # Model configuration
         model_config_frame = ttk.LabelFrame(model_frame, text="Model Configuration", padding=10)
@@ -54,7 +156,6 @@ class SettingsPanel(ttk.Frame):
 
         # Model path
         ttk.Label(model_config_frame, text="Model Path:").grid(row=0, column=0, sticky='w', pady=2)
-        self.model_path_var = tk.StringVar()
         model_path_entry = ttk.Entry(model_config_frame, textvariable=self.model_path_var, width=50)
         model_path_entry.grid(row=0, column=1, sticky='ew', padx=5, pady=2)
         ttk.Button(model_config_frame, text="Browse", command=self.browse_model_path).grid(row=0, column=2, pady=2)
@@ -70,27 +171,23 @@ class SettingsPanel(ttk.Frame):
 
         # Max tokens
         ttk.Label(gen_params_frame, text="Max Tokens:").grid(row=0, column=0, sticky='w', pady=2)
-        self.max_tokens_var = tk.IntVar(value=2048)
         max_tokens_spin = ttk.Spinbox(gen_params_frame, from_=512, to=8192, textvariable=self.max_tokens_var, width=10)
         max_tokens_spin.grid(row=0, column=1, sticky='w', padx=5, pady=2)
 
         # Temperature
         ttk.Label(gen_params_frame, text="Temperature:").grid(row=1, column=0, sticky='w', pady=2)
-        self.temperature_var = tk.DoubleVar(value=0.1)
         temp_scale = ttk.Scale(gen_params_frame, from_=0.0, to=2.0, variable=self.temperature_var, orient='horizontal')
         temp_scale.grid(row=1, column=1, sticky='ew', padx=5, pady=2)
         ttk.Label(gen_params_frame, textvariable=self.temperature_var).grid(row=1, column=2, padx=5, pady=2)
 
         # Top-p
         ttk.Label(gen_params_frame, text="Top-p:").grid(row=2, column=0, sticky='w', pady=2)
-        self.top_p_var = tk.DoubleVar(value=0.95)
         top_p_scale = ttk.Scale(gen_params_frame, from_=0.0, to=1.0, variable=self.top_p_var, orient='horizontal')
         top_p_scale.grid(row=2, column=1, sticky='ew', padx=5, pady=2)
         ttk.Label(gen_params_frame, textvariable=self.top_p_var).grid(row=2, column=2, padx=5, pady=2)
 
         # Repeat penalty
         ttk.Label(gen_params_frame, text="Repeat Penalty:").grid(row=3, column=0, sticky='w', pady=2)
-        self.repeat_penalty_var = tk.DoubleVar(value=1.1)
         repeat_penalty_scale = ttk.Scale(gen_params_frame, from_=1.0, to=2.0, variable=self.repeat_penalty_var,
                                          orient='horizontal')
         repeat_penalty_scale.grid(row=3, column=1, sticky='ew', padx=5, pady=2)
@@ -100,10 +197,8 @@ class SettingsPanel(ttk.Frame):
         model_config_frame.grid_columnconfigure(1, weight=1)
         gen_params_frame.grid_columnconfigure(1, weight=1)
 
-    def create_project_settings_tab(self):
+    def create_project_settings_tab(self, project_frame):
         """Create project settings tab"""
-        project_frame = ttk.Frame(self.notebook)
-        self.notebook.add(project_frame, text="📱 Project")
 
         # Project configuration
         project_config_frame = ttk.LabelFrame(project_frame, text="Project Configuration", padding=10)
@@ -111,7 +206,6 @@ class SettingsPanel(ttk.Frame):
 
         # Default output directory
         ttk.Label(project_config_frame, text="Default Output Directory:").grid(row=0, column=0, sticky='w', pady=2)
-        self.output_dir_var = tk.StringVar()
         output_dir_entry = ttk.Entry(project_config_frame, textvariable=self.output_dir_var, width=50)
         output_dir_entry.grid(row=0, column=1, sticky='ew', padx=5, pady=2)
         ttk.Button(project_config_frame, text="Browse", command=self.browse_output_dir).grid(row=0, column=2, pady=2)
@@ -122,25 +216,21 @@ class SettingsPanel(ttk.Frame):
 
         # Min SDK
         ttk.Label(android_frame, text="Minimum SDK:").grid(row=0, column=0, sticky='w', pady=2)
-        self.min_sdk_var = tk.IntVar(value=24)
         min_sdk_spin = ttk.Spinbox(android_frame, from_=16, to=34, textvariable=self.min_sdk_var, width=10)
         min_sdk_spin.grid(row=0, column=1, sticky='w', padx=5, pady=2)
 
         # Target SDK
         ttk.Label(android_frame, text="Target SDK:").grid(row=1, column=0, sticky='w', pady=2)
-        self.target_sdk_var = tk.IntVar(value=34)
         target_sdk_spin = ttk.Spinbox(android_frame, from_=24, to=34, textvariable=self.target_sdk_var, width=10)
         target_sdk_spin.grid(row=1, column=1, sticky='w', padx=5, pady=2)
 
         # Compile SDK
         ttk.Label(android_frame, text="Compile SDK:").grid(row=2, column=0, sticky='w', pady=2)
-        self.compile_sdk_var = tk.IntVar(value=34)
         compile_sdk_spin = ttk.Spinbox(android_frame, from_=24, to=34, textvariable=self.compile_sdk_var, width=10)
         compile_sdk_spin.grid(row=2, column=1, sticky='w', padx=5, pady=2)
 
         # Language preference
         ttk.Label(android_frame, text="Language:").grid(row=3, column=0, sticky='w', pady=2)
-        self.language_var = tk.StringVar(value="Kotlin")
         language_combo = ttk.Combobox(android_frame, textvariable=self.language_var, values=["Kotlin", "Java"],
                                       state="readonly")
         language_combo.grid(row=3, column=1, sticky='w', padx=5, pady=2)
@@ -149,10 +239,8 @@ class SettingsPanel(ttk.Frame):
         project_config_frame.grid_columnconfigure(1, weight=1)
         android_frame.grid_columnconfigure(1, weight=1)
 
-    def create_ui_settings_tab(self):
+    def create_ui_settings_tab(self, ui_frame):
         """Create UI settings tab"""
-        ui_frame = ttk.Frame(self.notebook)
-        self.notebook.add(ui_frame, text="🎨 Interface")
 
         # Appearance settings
         appearance_frame = ttk.LabelFrame(ui_frame, text="Appearance", padding=10)
@@ -160,14 +248,12 @@ class SettingsPanel(ttk.Frame):
 
         # Theme
         ttk.Label(appearance_frame, text="Theme:").grid(row=0, column=0, sticky='w', pady=2)
-        self.theme_var = tk.StringVar(value="System")
         theme_combo = ttk.Combobox(appearance_frame, textvariable=self.theme_var,
                                    values=["System", "Light", "Dark"], state="readonly")
         theme_combo.grid(row=0, column=1, sticky='w', padx=5, pady=2)
 
         # Font size
         ttk.Label(appearance_frame, text="Font Size:").grid(row=1, column=0, sticky='w', pady=2)
-        self.font_size_var = tk.IntVar(value=10)
         font_size_spin = ttk.Spinbox(appearance_frame, from_=8, to=16, textvariable=self.font_size_var, width=10)
         font_size_spin.grid(row=1, column=1, sticky='w', padx=5, pady=2)
 
@@ -176,22 +262,18 @@ class SettingsPanel(ttk.Frame):
         window_frame.pack(fill='x', padx=10, pady=5)
 
         # Remember window size
-        self.remember_size_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(window_frame, text="Remember window size and position",
                         variable=self.remember_size_var).grid(row=0, column=0, sticky='w', pady=2)
 
         # Auto-save chat
-        self.auto_save_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(window_frame, text="Auto-save chat history",
                         variable=self.auto_save_var).grid(row=1, column=0, sticky='w', pady=2)
 
         # Configure grid weights
         appearance_frame.grid_columnconfigure(1, weight=1)
 
-    def create_advanced_settings_tab(self):
+    def create_advanced_settings_tab(self, advanced_frame):
         """Create advanced settings tab"""
-        advanced_frame = ttk.Frame(self.notebook)
-        self.notebook.add(advanced_frame, text="⚙️ Advanced")
 
         # Performance settings
         performance_frame = ttk.LabelFrame(advanced_frame, text="Performance", padding=10)
@@ -199,13 +281,11 @@ class SettingsPanel(ttk.Frame):
 
         # Memory limit
         ttk.Label(performance_frame, text="Memory Limit (MB):").grid(row=0, column=0, sticky='w', pady=2)
-        self.memory_limit_var = tk.IntVar(value=2048)
         memory_spin = ttk.Spinbox(performance_frame, from_=512, to=8192, textvariable=self.memory_limit_var, width=10)
         memory_spin.grid(row=0, column=1, sticky='w', padx=5, pady=2)
 
         # Thread count
         ttk.Label(performance_frame, text="Thread Count:").grid(row=1, column=0, sticky='w', pady=2)
-        self.thread_count_var = tk.IntVar(value=4)
         thread_spin = ttk.Spinbox(performance_frame, from_=1, to=16, textvariable=self.thread_count_var, width=10)
         thread_spin.grid(row=1, column=1, sticky='w', padx=5, pady=2)
 
@@ -214,12 +294,10 @@ class SettingsPanel(ttk.Frame):
         debug_frame.pack(fill='x', padx=10, pady=5)
 
         # Enable logging
-        self.enable_logging_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(debug_frame, text="Enable detailed logging",
                         variable=self.enable_logging_var).grid(row=0, column=0, sticky='w', pady=2)
 
         # Show debug info
-        self.show_debug_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(debug_frame, text="Show debug information",
                         variable=self.show_debug_var).grid(row=1, column=0, sticky='w', pady=2)
 
@@ -284,10 +362,12 @@ class SettingsPanel(ttk.Frame):
         """Load settings from file"""
         try:
             if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r') as f:
-                    loaded_settings = json.load(f)
-                    # Merge with defaults
-                    self.merge_settings(loaded_settings)
+                # Read the whole file in one shot and parse in memory,
+                # skipping the buffered text-io layer
+                with open(self.settings_file, 'rb') as f:
+                    loaded_settings = json.loads(f.read())
+                # Merge with defaults
+                self.merge_settings(loaded_settings)
 
             self.update_ui_from_settings()
 
@@ -302,38 +382,32 @@ class SettingsPanel(ttk.Frame):
 
     def update_ui_from_settings(self):
         """Update UI controls from settings"""
-        # Model settings
-        self.model_path_var.set(self.settings['model']['path'])
-        self.max_tokens_var.set(self.settings['model']['max_tokens'])
-        self.temperature_var.set(self.settings['model']['temperature'])
-        self.top_p_var.set(self.settings['model']['top_p'])
-        self.repeat_penalty_var.set(self.settings['model']['repeat_penalty'])
-
-        # Project settings
-        self.output_dir_var.set(self.settings['project']['output_directory'])
-        self.min_sdk_var.set(self.settings['project']['min_sdk'])
-        self.target_sdk_var.set(self.settings['project']['target_sdk'])
-        self.compile_sdk_var.set(self.settings['project']['compile_sdk'])
-        self.language_var.set(self.settings['project']['language'])
-
-        # UI settings
-        self.theme_var.set(self.settings['ui']['theme'])
-        self.font_size_var.set(self.settings['ui']['font_size'])
-        self.remember_size_var.set(self.settings['ui']['remember_size'])
-        self.auto_save_var.set(self.settings['ui']['auto_save'])
-
-        # Advanced settings
-        self.memory_limit_var.set(self.settings['advanced']['memory_limit'])
-        self.thread_count_var.set(self.settings['advanced']['thread_count'])
-        self.enable_logging_var.set(self.settings['advanced']['enable_logging'])
-        self.show_debug_var.set(self.settings['advanced']['show_debug'])
+        # Writing a Tk variable re-fires its traces even for the same
+        # value, so skip variables that already hold the target value
+        for attr, category, key in self._VAR_MAP:
+            var = getattr(self, attr)
+            value = self.settings[category][key]
+            try:
+                unchanged = var.get() == value
+            except tk.TclError:
+                # Non-numeric junk typed into a numeric field makes
+                # get() raise; just overwrite it
+                unchanged = False
+            if not unchanged:
+                var.set(value)
 
         # Update model status
         self.update_model_status()
 
     def update_model_status(self):
         """Update model status display"""
-        if self.llm_manager.is_ready():
+        now = time.monotonic()
+        checked, ready = self._status_cache
+        if ready is None or now - checked > 0.5:
+            ready = self.llm_manager.is_ready()
+            self._status_cache = (now, ready)
+
+        if ready:
             self.model_status_label.config(text="✅ Loaded", foreground="green")
         else:
             self.model_status_label.config(text="❌ Not Loaded", foreground="red")
@@ -362,52 +436,48 @@ class SettingsPanel(ttk.Frame):
 
     def open_settings_folder(self):
         """Open settings folder in file explorer"""
-        settings_dir = os.path.dirname(self.settings_file)
-        if not os.path.exists(settings_dir):
+        settings_dir = os.path.dirname(os.path.abspath(self.settings_file))
+        if settings_dir and not os.path.isdir(settings_dir):
             os.makedirs(settings_dir)
 
         try:
-            if os.name == 'nt':  # Windows
+            if sys.platform == 'win32':
                 os.startfile(settings_dir)
-            elif os.name == 'posix':  # macOS and Linux
-                import subprocess
-                subprocess.run(['xdg-open', settings_dir] if os.name == 'posix' else ['open', settings_dir])
+            else:
+                opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+                # Detach so the GUI never blocks on the file manager
+                subprocess.Popen([opener, settings_dir],
+                                 stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL,
+                                 start_new_session=True)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open settings folder: {str(e)}")
 
     def cancel_settings(self):
         """Cancel settings changes"""
-        self.load_settings()  # Reload from file
+        # Revert to the snapshot taken when the panel was shown; no
+        # need to hit the disk for this
+        self.settings = copy.deepcopy(self._settings_snapshot)
+        self.update_ui_from_settings()
 
     def apply_settings(self):
         """Apply settings changes"""
         try:
             # Update settings from UI
-            self.settings['model']['path'] = self.model_path_var.get()
-            self.settings['model']['max_tokens'] = self.max_tokens_var.get()
-            self.settings['model']['temperature'] = self.temperature_var.get()
-            self.settings['model']['top_p'] = self.top_p_var.get()
-            self.settings['model']['repeat_penalty'] = self.repeat_penalty_var.get()
-
-            self.settings['project']['output_directory'] = self.output_dir_var.get()
-            self.settings['project']['min_sdk'] = self.min_sdk_var.get()
-            self.settings['project']['target_sdk'] = self.target_sdk_var.get()
-            self.settings['project']['compile_sdk'] = self.compile_sdk_var.get()
-            self.settings['project']['language'] = self.language_var.get()
-
-            self.settings['ui']['theme'] = self.theme_var.get()
-            self.settings['ui']['font_size'] = self.font_size_var.get()
-            self.settings['ui']['remember_size'] = self.remember_size_var.get()
-            self.settings['ui']['auto_save'] = self.auto_save_var.get()
-
-            self.settings['advanced']['memory_limit'] = self.memory_limit_var.get()
-            self.settings['advanced']['thread_count'] = self.thread_count_var.get()
-            self.settings['advanced']['enable_logging'] = self.enable_logging_var.get()
-            self.settings['advanced']['show_debug'] = self.show_debug_var.get()
-
-            # Save to file
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            for attr, category, key in self._VAR_MAP:
+                self.settings[category][key] = getattr(self, attr).get()
+
+            # Serialize fully in memory, write to a temp file, fsync and
+            # atomically swap so a crash can't leave a truncated file
+            payload = _dumps(self.settings)
+            tmp = self.settings_file + '.tmp'
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, payload)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp, self.settings_file)
 
             # Apply to LLM manager
             self.llm_manager.set_generation_params(
@@ -428,9 +498,14 @@ class SettingsPanel(ttk.Frame):
                 if not self.llm_manager.load_model():
                     raise RuntimeError("Failed to load model after applying settings")
 
-            # Refresh status
+            # Refresh status, bypassing the TTL cache since the model
+            # state may have just changed
+            self._status_cache = (0.0, None)
             self.update_model_status()
 
+            # Applied settings become the new Cancel baseline
+            self._snapshot_settings()
+
             messagebox.showinfo("Success", "Settings applied successfully!")
 
         except Exception as e:
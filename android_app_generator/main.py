@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Android App Generator - Main Entry Point
+
+A powerful desktop application that uses local AI models to generate 
+complete Android applications from natural language descriptions.
+
+Author: Android App Generator Team
+Version: 1.0.0
+"""
+
+import sys
+import os
+from pathlib import Path
+from tkinter import messagebox
+import traceback
+
+
+def setup_environment():
+    """Setup the application environment"""
+    # Create necessary directories
+    directories = [
+        "models",
+        "config",
+        "output",
+        "templates",
+        "logs"
+    ]
+
+    # Anchor everything on the project root (one level above this
+    # package) rather than the CWD, and keep the single scandir pass:
+    # mkdir only what is actually missing
+    root = Path(__file__).resolve().parent.parent
+    existing = {entry.name for entry in os.scandir(root) if entry.is_dir()}
+    for directory in directories:
+        if directory not in existing:
+            try:
+                (root / directory).mkdir()
+            except FileExistsError:
+                pass
+
+    # Set up logging; records go through a queue to a background
+    # listener so logger calls never block the calling thread on disk
+    import atexit
+    import logging
+    import queue
+    from logging.handlers import QueueHandler, QueueListener
+
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue,
+        logging.FileHandler(root / 'logs' / 'app.log'),
+        logging.StreamHandler(),
+        respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[QueueHandler(log_queue)]
+    )
+
+
+# Third-party/optional modules the app cannot run without; stdlib modules
+# are always present and aren't worth a lookup
+_REQUIRED_PACKAGES = frozenset({'gpt4all', 'tkinter'})
+
+
+def check_dependencies():
+    """Check if all required dependencies are available"""
+    from importlib.util import find_spec
+
+    # find_spec is a pure metadata lookup: no module code runs just to
+    # prove the package is installed
+    missing_packages = sorted(
+        name for name in _REQUIRED_PACKAGES if find_spec(name) is None
+    )
+
+    if missing_packages:
+        error_msg = f"Missing required packages: {', '.join(missing_packages)}\n\n"
+        error_msg += "Please install them using:\n"
+        error_msg += "pip install -r requirements.txt"
+        messagebox.showerror("Missing Dependencies", error_msg)
+        return False
+
+    return True
+
+
+def main():
+    """Main application entry point"""
+    try:
+        # Setup environment
+        setup_environment()
+
+        # Check dependencies
+        if not check_dependencies():
+            sys.exit(1)
+
+        # Imported here so startup checks run before the GUI stack (and,
+        # transitively, the model backend) gets loaded
+        from android_app_generator.gui.main_window import MainWindow
+
+        # Create and run main application
+        try:
+            app = MainWindow()
+            app.run()
+        except Exception as e:
+            error_msg = f"Failed to create main window: {str(e)}"
+            print(error_msg)
+            messagebox.showerror("Application Error", error_msg)
+            raise
+
+    except KeyboardInterrupt:
+        print("\nApplication interrupted by user")
+        sys.exit(0)
+
+    except Exception as e:
+        error_msg = f"Application error: {str(e)}\n\n"
+        error_msg += "Please check the logs for more details."
+
+        # Try to show error dialog, fallback to console if tkinter fails
+        try:
+            messagebox.showerror("Application Error", error_msg)
+        except:
+            print(error_msg)
+            traceback.print_exc()
+
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -6,14 +6,8 @@ Simple launcher for the Android App Generator application.
 This script provides an easy way to start the application.
 """
 
-import sys
-import os
-
-# Add the current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 # Import and run the main application
-from main import main
+from android_app_generator.main import main
 
 if __name__ == "__main__":
     main()
\ No newline at end of file